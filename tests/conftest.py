@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# The tools are standalone scripts, not a package; import them from tools/
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "tools"))
@@ -0,0 +1,72 @@
+import csv
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from _batch import batch_outputs
+
+TOOLS = pathlib.Path(__file__).resolve().parents[1] / "tools"
+
+
+def test_batch_outputs_keep_input_suffix_and_subdirs(tmp_path):
+    paths = [str(tmp_path / d / f) for d, f in (("b", "x.rpt"), ("b", "x.txt"), ("c", "x.rpt"))]
+    expected = [
+        os.path.join("out", "b", "x.rpt.csv"),
+        os.path.join("out", "b", "x.txt.csv"),
+        os.path.join("out", "c", "x.rpt.csv"),
+    ]
+    assert batch_outputs(paths, "out", ".csv") == expected
+
+
+def _run(tool, *args, **kw):
+    env = dict(os.environ, CTS_CACHE="")
+    return subprocess.run(
+        [sys.executable, str(TOOLS / tool), *args], capture_output=True, text=True, env=env, **kw
+    )
+
+
+@pytest.fixture
+def corners(tmp_path):
+    """Two per-corner reports, ss/run.rpt and ff/run.rpt, with different slack."""
+    for corner, wns in (("ss", "-0.120"), ("ff", "0.015")):
+        (tmp_path / "in" / corner).mkdir(parents=True)
+        (tmp_path / "in" / corner / "run.rpt").write_text(
+            f"Startpoint: {corner}_s\nEndpoint: {corner}_e\nWNS: {wns} TNS: -1.000\n"
+        )
+    return tmp_path
+
+
+def test_cts_tuner_batch_writes_one_json_per_input(corners):
+    out = corners / "out"
+    _run("cts_tuner.py", "--inputs", str(corners / "in/*/run.rpt"), "--out", str(out),
+         "--jobs", "2", check=True)
+    for corner, wns in (("ss", -0.12), ("ff", 0.015)):
+        result = json.loads((out / corner / "run.rpt.json").read_bytes())
+        assert result["summary"]["wns"] == wns
+
+
+def test_sta_report_parser_batch_writes_one_csv_per_input(corners):
+    out = corners / "out"
+    _run("sta_report_parser.py", "--inputs", str(corners / "in/*/run.rpt"), "--out", str(out),
+         check=True)
+    for corner, wns in (("ss", "-0.12"), ("ff", "0.015")):
+        with open(out / corner / "run.rpt.csv", newline="") as f:
+            assert list(csv.DictReader(f)) == [
+                {"WNS": wns, "TNS": "-1.0", "Start": f"{corner}_s", "End": f"{corner}_e"}
+            ]
+
+
+@pytest.mark.parametrize("args, message", [
+    (["--inputs", "{in}/*/run.rpt", "--skew-rpt", "x.rpt"], "--skew-rpt cannot be combined"),
+    (["--inputs", "{in}/*/missing.rpt"], "--inputs matched no files"),
+    (["--log", "{in}/ss/run.rpt", "--jobs", "2"], "--jobs only applies with --inputs"),
+])
+def test_cts_tuner_batch_usage_errors(corners, args, message):
+    args = [a.format(**{"in": corners / "in"}) for a in args]
+    run = _run("cts_tuner.py", *args, "--out", str(corners / "out"))
+    assert run.returncode == 2 and message in run.stderr
+    assert not (corners / "out").exists()
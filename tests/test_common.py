@@ -0,0 +1,29 @@
+import argparse
+import re
+
+import pytest
+
+import _common
+from _common import dumps_json, positive_int, split_wns_tns
+
+
+def test_positive_int_rejects_zero():
+    assert positive_int("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int("0")
+
+
+def test_split_wns_tns_follows_the_given_grammar():
+    loose = re.compile(rb"[+-]?[\d.]+")
+    assert split_wns_tns(b"WNS: -0.5 TNS: -2", loose) == (-0.5, -2.0)
+    assert split_wns_tns(b"WNS: 1.2.3 TNS: 0", loose) is None  # matches, but float() fails
+    assert split_wns_tns(b"WNS: 1e-3 TNS: 0", loose) is None
+    assert split_wns_tns(b"WNS: -0.5 slack TNS: -2", loose) is None
+
+
+def test_dumps_json_stdlib_fallback_matches_orjson(monkeypatch):
+    obj = {"notes": ["Reduce insertion delay ~10–15%"], "wns": -0.12, "tns": None}
+    first = dumps_json(obj)
+    monkeypatch.setattr(_common, "orjson", None)
+    assert dumps_json(obj) == first
+    assert "–" in first.decode()
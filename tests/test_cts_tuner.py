@@ -0,0 +1,188 @@
+import importlib.util
+import itertools
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import cts_tuner
+
+TOOLS = pathlib.Path(cts_tuner.__file__).resolve().parent
+
+
+def test_wns_fast_path_rejects_non_numeric_slack():
+    lines = [b"WNS: INFINITY TNS: 0.000\n", b"WNS: -0.250 TNS: -12.000\n"]
+    assert cts_tuner.parse_wns_tns_from_log(lines) == {"WNS": -0.25, "TNS": -12.0}
+
+
+def test_wns_tns_on_separate_lines():
+    lines = [b"WNS: -1\n", b"other\n", b"tns: -2.5\n"]
+    assert cts_tuner.parse_wns_tns_from_log(lines) == {"WNS": -1.0, "TNS": -2.5}
+
+
+def test_skew_report_mid_line_insertion_delay():
+    lines = [
+        b"Clock Domain: core_clk\n",
+        b"  Clock network latency / Insertion Delay : 2.0 ns\n",
+        b"  Global skew: 125 ps\n",
+    ]
+    assert cts_tuner.parse_ccopt_skew_report(lines) == {
+        "core_clk": {"avg_insertion_ns": 2.0, "global_skew_ps": 125.0}
+    }
+
+
+_GRID = list(itertools.product(
+    [None, 0.05, -0.01, -0.02, -0.05, -0.10, -0.3, float("nan")],
+    [False, True],
+    [None, 0.5, 0.8, 1.2, 2.0, 3.0],
+    [None, 50.0, 120.0, 150.0],
+))
+
+
+def _none_to_nan(col):
+    return [float("nan") if v is None else v for v in col]
+
+
+def _check_grid(targets_batch):
+    wns, hold, ins, skew = zip(*_GRID)
+    got_ins, got_skew = targets_batch(
+        _none_to_nan(wns), hold, _none_to_nan(ins), _none_to_nan(skew)
+    )
+    for i, (w, h, a, g) in enumerate(_GRID):
+        w = None if w is None or w != w else w
+        want_ins, want_skew, _ = cts_tuner._recommend_core(w, h, a, g)
+        assert (got_ins[i], got_skew[i]) == pytest.approx((want_ins, want_skew)), _GRID[i]
+
+
+def test_recommend_batch_matches_core_with_numba():
+    pytest.importorskip("numba")
+    _check_grid(cts_tuner.recommend_batch)
+
+
+def test_recommend_batch_matches_core_without_numba(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numba", None)  # makes "from numba import ..." fail
+    spec = importlib.util.spec_from_file_location("_cts_kernels_py", TOOLS / "_cts_kernels.py")
+    kernels = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(kernels)
+    assert kernels.prange is range
+    _check_grid(kernels.targets_batch)
+
+
+def test_import_does_not_load_numba():
+    code = "import sys, cts_tuner; print('numba' in sys.modules, 'numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=TOOLS, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_unparsable_skew_report_is_noted(monkeypatch):
+    monkeypatch.setenv("CTS_CACHE", "")
+    log = "WNS: 0.010 TNS: 0.000\n"
+    note = "No domains parsed from skew report; check report format."
+    result = cts_tuner.propose_tuning(log, "nothing recognisable here\n", None, None)
+    assert note in result["summary"]["notes"]
+    assert [r["domain"] for r in result["recommendations"]] == ["default"]
+    assert note not in cts_tuner.propose_tuning(log, None, None, None)["summary"]["notes"]
+
+
+def test_propose_tuning_text_matches_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("CTS_CACHE", "")
+    log_text = "WNS: -0.120 TNS: -57.000\nhold violation on u1/D\n"
+    skew_text = "Clock Domain: core_clk\nAverage insertion delay: 1.82 ns\nGlobal skew: 125 ps\n"
+    (tmp_path / "cts.log").write_text(log_text)
+    (tmp_path / "ccopt.skew.rpt").write_text(skew_text)
+    from_files = cts_tuner.propose_tuning_json(
+        str(tmp_path / "cts.log"), str(tmp_path / "ccopt.skew.rpt"), None, None
+    )
+    assert cts_tuner.propose_tuning(log_text, skew_text, None, None) == json.loads(from_files)
+
+
+@pytest.fixture
+def cts_run(tmp_path, monkeypatch):
+    """A log file to tune, its text, and a counter of real (uncached) computations."""
+    log = tmp_path / "cts.log"
+    text = "WNS: -0.050 TNS: -3.000\nhold violation on u1/D\n"
+    log.write_text(text)
+    calls = []
+    uncached = cts_tuner._propose_tuning_uncached
+    monkeypatch.setattr(
+        cts_tuner, "_propose_tuning_uncached", lambda *a: calls.append(a) or uncached(*a)
+    )
+    return str(log), text, calls
+
+
+def test_cache_miss_then_hit(cts_run, tmp_path, monkeypatch):
+    log, text, calls = cts_run
+    monkeypatch.setenv("CTS_CACHE", str(tmp_path / "cache"))
+    first = cts_tuner.propose_tuning_json(log, None, None, None)
+    assert len(calls) == 1 and len(list((tmp_path / "cache").glob("*.json"))) == 1
+    assert cts_tuner.propose_tuning_json(log, None, None, None) == first
+    # Keyed on contents, so the text entry point hits the file's entry
+    assert cts_tuner.propose_tuning(text, None, None, None) == json.loads(first)
+    assert len(calls) == 1
+
+
+def test_code_change_invalidates_cache(cts_run, tmp_path, monkeypatch):
+    _, text, calls = cts_run
+    monkeypatch.setenv("CTS_CACHE", str(tmp_path / "cache"))
+    cts_tuner.propose_tuning(text, None, None, None)
+    monkeypatch.setattr(cts_tuner, "_CODE_DIGEST", b"edited" + cts_tuner._CODE_DIGEST)
+    cts_tuner.propose_tuning(text, None, None, None)
+    assert len(calls) == 2 and len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+
+def test_cache_disabled(cts_run, tmp_path, monkeypatch):
+    _, text, calls = cts_run
+    monkeypatch.setenv("CTS_CACHE", "")
+    monkeypatch.chdir(tmp_path)
+    cts_tuner.propose_tuning(text, None, None, None)
+    cts_tuner.propose_tuning(text, None, None, None)
+    assert len(calls) == 2 and not (tmp_path / ".cts_cache").exists()
+
+
+def test_unwritable_cache_is_not_fatal(cts_run, tmp_path, monkeypatch):
+    _, text, calls = cts_run
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv("CTS_CACHE", str(blocker))
+    result = cts_tuner.propose_tuning(text, None, None, None)
+    assert result["summary"]["hold_issues"] is True and len(calls) == 1
+
+
+def test_truncated_cache_entry_is_recomputed(cts_run, tmp_path, monkeypatch):
+    log, _, calls = cts_run
+    monkeypatch.setenv("CTS_CACHE", str(tmp_path / "cache"))
+    good = cts_tuner.propose_tuning_json(log, None, None, None)
+    (entry,) = (tmp_path / "cache").glob("*.json")
+    entry.write_bytes(good[: len(good) // 2])
+    assert cts_tuner.propose_tuning_json(log, None, None, None) == good
+    assert len(calls) == 2 and entry.read_bytes() == good
+
+
+def test_msgspec_output_matches_dumps(monkeypatch):
+    msgspec = pytest.importorskip("msgspec")
+    # cts_tuner only builds msgspec records when orjson is missing; load a copy that way
+    # (with a fresh _common, which is where orjson gets imported)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.delitem(sys.modules, "_common", raising=False)
+    spec = importlib.util.spec_from_file_location("_cts_tuner_msgspec", TOOLS / "cts_tuner.py")
+    tuner = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tuner)
+    # Setup and hold failing plus high skew, so the notes carry non-ASCII "–" and "≤"
+    records = tuner._propose_tuning_uncached(
+        [b"WNS: -0.150 TNS: -9.000\n", b"hold violation on u1/D\n"],
+        [b"Clock Domain: core_clk\n", b"Average insertion delay: 1.82 ns\n", b"Skew: 150 ps\n"],
+        None,
+        None,
+    )
+    assert isinstance(records, msgspec.Struct)
+    plain = msgspec.to_builtins(records)
+    data = tuner._encode(records)
+    assert data == cts_tuner.dumps_json(plain) == tuner.dumps_json(plain)
+    assert "–" in data.decode()
+    # recommend_for_domain stays a plain dict and agrees with the Struct record
+    args = ("core_clk", -0.15, True, 1.82, 150.0)
+    assert tuner.recommend_for_domain(*args) == msgspec.to_builtins(tuner._domain_reco(*args))
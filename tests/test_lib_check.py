@@ -0,0 +1,11 @@
+from lib_check import missing_cells
+
+
+def test_missing_cells_match_exact_cell_names():
+    data = (
+        b"library (x) {\n"
+        b"  cell (BUF_X4) {\n    test_cell (INV_X1) { }\n  }\n"
+        b'  cell ("NAND2_X2") { }\n'
+        b"}\n"
+    )
+    assert missing_cells(data, ["BUF", "BUF_X4", "NAND2_X2", "INV_X1"]) == ["BUF", "INV_X1"]
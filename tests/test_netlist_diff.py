@@ -0,0 +1,10 @@
+from netlist_diff import summarize_modules
+
+
+def test_dollar_and_escaped_module_names_stay_distinct():
+    data = b"module foo$bar(a);\nmodule \\esc.mod (a);\nmodule foo(b);\n"
+    assert summarize_modules(data) == {"foo$bar": 1, "\\esc.mod": 1, "foo": 1}
+
+
+def test_non_utf8_escaped_module_name_is_decoded_leniently():
+    assert summarize_modules(b"module \\foo\xe9 (a);\n") == {"\\foo": 1}
@@ -0,0 +1,16 @@
+from sta_report_parser import parse_report_text
+
+
+def test_bare_startpoint_keeps_its_endpoint():
+    data = b"Startpoint:\nEndpoint: e1\nStartpoint: s2\nEndpoint:\n"
+    assert parse_report_text(data)["paths"] == [
+        {"start": "", "end": "e1"},
+        {"start": "s2", "end": ""},
+    ]
+
+
+def test_fast_path_rejects_non_numeric_slack():
+    # float() accepts INFINITY; the summary grammar does not, so the earlier real line wins
+    data = b"WNS: -0.250 TNS: -12.000\nWNS: INFINITY TNS: 0.000\n"
+    summary = parse_report_text(data)
+    assert (summary["WNS"], summary["TNS"]) == (-0.25, -12.0)
@@ -0,0 +1,65 @@
+"""Shared --inputs/--jobs batch mode for the report-parsing tools.
+
+Each tool passes a top-level ``parse_one(input_path, out_path, *extra)`` function
+(top-level so ProcessPoolExecutor can pickle it) that parses one file and writes
+its output through write_bytes/write_csv.
+"""
+import argparse, glob, logging, os, pathlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, List
+
+from _common import positive_int
+
+logger = logging.getLogger(__name__)
+
+def add_batch_args(ap: argparse.ArgumentParser, single_flag: str, single_help: str) -> None:
+    # Exactly one of the tool's single-file flag or --inputs; --out is a directory with --inputs
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument(single_flag, help=single_help)
+    src.add_argument("--inputs", help="Glob of input files to parse in parallel (quote it)")
+    ap.add_argument(
+        "--jobs", type=positive_int, help="Worker processes for --inputs (default: CPU count)"
+    )
+
+def parse_batch_args(ap: argparse.ArgumentParser) -> argparse.Namespace:
+    # ap.parse_args() plus the cross-flag check argparse groups can't express
+    args = ap.parse_args()
+    if args.jobs is not None and not args.inputs:
+        ap.error("--jobs only applies with --inputs")
+    return args
+
+def batch_outputs(paths: List[str], out_dir: str, suffix: str) -> List[str]:
+    # Mirror each input below the inputs' common directory into out_dir and append the
+    # suffix (ss/x.rpt -> out_dir/ss/x.rpt.csv) so no two inputs share an output path
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    return [
+        str(pathlib.Path(out_dir) / (os.path.relpath(os.path.abspath(p), root) + suffix))
+        for p in paths
+    ]
+
+def run_batch(
+    ap: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    parse_one: Callable[..., str],
+    suffix: str,
+    *extra: Any,
+) -> None:
+    paths = sorted(glob.glob(args.inputs))
+    if not paths:
+        ap.error(f"--inputs matched no files: {args.inputs}")
+    outs = batch_outputs(paths, args.out, suffix)
+    with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+        list(ex.map(parse_one, paths, outs, *(repeat(x) for x in extra)))
+
+def write_bytes(out: str, data: bytes) -> str:
+    pathlib.Path(out).parent.mkdir(parents=True, exist_ok=True)
+    pathlib.Path(out).write_bytes(data)
+    logger.info("Wrote %s", out)
+    return out
+
+def write_csv(out: str, df: Any) -> str:
+    pathlib.Path(out).parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(out, index=False)
+    logger.info("Wrote %s", out)
+    return out
@@ -0,0 +1,38 @@
+"""Small helpers shared by the tools: argparse validators, JSON output, WNS/TNS fast path."""
+import argparse, json
+from typing import Any, Optional, Pattern, Tuple
+
+try:
+    import orjson
+except ImportError:  # dumps_json falls back to the stdlib encoder
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {n}")
+    return n
+
+def dumps_json(obj: Any) -> bytes:
+    # Indented JSON bytes via orjson when installed. The stdlib fallback writes raw UTF-8
+    # (ensure_ascii=False) like orjson, so a tool's output bytes don't depend on which ran.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+def split_wns_tns(chunk: bytes, num_re: Pattern[bytes]) -> Optional[Tuple[float, float]]:
+    # str.find/split fast path for the verbatim 'WNS: <x> TNS: <y>' form; None means fall
+    # back to the caller's regex. Both values must fullmatch num_re, the number grammar of
+    # that regex, so the fast path accepts nothing the regex would reject (float() alone
+    # would also take inf/nan/1e-3).
+    parts = chunk.replace(b"WNS:", b"WNS ").replace(b"TNS:", b"TNS ").split(None, 4)
+    if len(parts) < 4 or parts[0] != b"WNS" or parts[2] != b"TNS":
+        return None
+    if not (num_re.fullmatch(parts[1]) and num_re.fullmatch(parts[3])):
+        return None
+    try:
+        return float(parts[1]), float(parts[3])
+    except ValueError:  # grammars like [\d.]+ also match "1.2.3"
+        return None
@@ -0,0 +1,58 @@
+"""Numeric CTS heuristic kernels behind cts_tuner.recommend_batch.
+
+Kept out of cts_tuner so numpy/numba are only imported when a batch is requested;
+the CLI never needs them.
+"""
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pure-Python fallback: same code, interpreted
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
+
+@njit(cache=True)
+def targets_numeric(wns: float, has_hold: bool, ins: float, skew: float) -> Tuple[float, float]:
+    """
+    Numeric-only mirror of cts_tuner._recommend_core (keep the two in sync); NaN stands in for None.
+    """
+    t_ins = 1.50 if np.isnan(ins) else ins
+    t_skew = 80.0
+    if wns < -0.02:
+        t_ins = max(0.7, round(t_ins * (0.85 if wns < -0.10 else 0.9), 3))
+        t_skew = min(70.0, t_skew)
+    if has_hold:
+        t_ins = round(t_ins * 1.08, 3)
+        t_skew = max(90.0, t_skew)
+    if skew > 120.0:
+        t_skew = min(t_skew, 70.0)
+    return min(max(t_ins, 0.6), 2.2), min(max(t_skew, 60.0), 120.0)
+
+@njit(parallel=True, cache=True)
+def _targets_kernel(wns, has_hold, ins, skew):
+    n = wns.shape[0]
+    ins_out = np.empty(n)
+    skew_out = np.empty(n)
+    for i in prange(n):
+        ins_out[i], skew_out[i] = targets_numeric(wns[i], has_hold[i], ins[i], skew[i])
+    return ins_out, skew_out
+
+def targets_batch(
+    wns_arr: Iterable[Optional[float]],
+    has_hold_arr: Iterable[bool],
+    ins_arr: Iterable[Optional[float]],
+    skew_arr: Iterable[Optional[float]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    wns = np.asarray(wns_arr, dtype=np.float64)
+    ins = np.asarray(ins_arr, dtype=np.float64)
+    skew = np.asarray(skew_arr, dtype=np.float64)
+    has_hold = np.asarray(has_hold_arr, dtype=np.bool_)
+    if not (wns.shape == has_hold.shape == ins.shape == skew.shape and wns.ndim == 1):
+        raise ValueError("recommend_batch inputs must be 1-D arrays of equal length")
+    return _targets_kernel(wns, has_hold, ins, skew)
@@ -7,10 +7,32 @@ Usage:
     --log samples/tempus_report.txt \
     --out outputs/cts_reco.json \
     [--skew-rpt path/to/ccopt.skew.rpt] [--wns -0.120] [--has-hold]
+
+Batch mode (one JSON per log, written into the --out directory; no --skew-rpt):
+  python tools/cts_tuner.py --inputs 'runs/*/cts.log' --out outputs/cts_reco --jobs 8
+  (runs/ss/cts.log -> outputs/cts_reco/ss/cts.log.json)
+
+Results are cached on disk keyed by the input file contents, overrides and the
+tool's own source, so re-runs on unchanged reports are instant. The cache lives in $CTS_CACHE
+(default: .cts_cache); set CTS_CACHE= (empty) to disable it.
 """
 
-import argparse, json, logging, pathlib, re
-from typing import Dict, Any, List, Optional
+import argparse, contextlib, hashlib, json, logging, os, pathlib, re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from _batch import add_batch_args, parse_batch_args, run_batch, write_bytes
+from _common import HAVE_ORJSON, dumps_json, split_wns_tns
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# msgspec records only stand in for orjson: orjson on plain dicts beats msgspec's
+# encode + indent pass, and both are ~2.5x faster than the stdlib encoder
+msgspec = None
+if not HAVE_ORJSON:
+    with contextlib.suppress(ImportError):
+        import msgspec
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -19,47 +41,101 @@ logger = logging.getLogger(__name__)
 # Parsing helpers
 # ---------------------------
 
-def parse_wns_tns_from_log(text: str) -> Dict[str, Optional[float]]:
+# Precompiled bytes patterns (shared across calls and per-line loops); reports are read
+# in binary so only the small captured groups get decoded. Input is streamed one line
+# at a time, so [ \t] (not \s) keeps each field gap on the line without needing anchors.
+_PAT_WNS_TNS = re.compile(
+    rb"WNS:[ \t]*([+-]?\d+(?:\.\d+)?)[ \t]+TNS:[ \t]*([+-]?\d+(?:\.\d+)?)", re.I
+)
+_PAT_WNS = re.compile(rb"WNS:[ \t]*([+-]?\d+(?:\.\d+)?)", re.I)
+_PAT_TNS = re.compile(rb"TNS:[ \t]*([+-]?\d+(?:\.\d+)?)", re.I)
+_PAT_DOMAIN = re.compile(rb"^(?:Clock[ \t]*)?Domain[ \t]*:[ \t]*(\S+)", re.M | re.I)
+# Unanchored: also catches mid-line forms like "Clock network latency / Insertion Delay : 2.0 ns"
+_PAT_INS = re.compile(
+    rb"(?:Average[ \t]+insertion[ \t]+delay|Insertion[ \t]+Delay)[ \t]*:[ \t]*([0-9.]+)[ \t]*ns",
+    re.I,
+)
+_PAT_SKEW = re.compile(rb"(?:Global[ \t]+skew|Skew)[ \t]*:[ \t]*([0-9.]+)[ \t]*ps", re.I)
+
+# Number grammar of the patterns above, for the split_wns_tns fast path
+_NUM = re.compile(rb"[+-]?\d+(?:\.\d+)?")
+
+# Lowercase needles for parse_hold_presence; every one contains "hold"
+_HOLD_NEEDLES = (
+    b"hold violation",
+    b"negative hold slack",
+    b"slack (hold)",
+    b"hold slack (violated)",
+)
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """
+    Streams a (possibly multi-GB) report as raw byte lines with a 1 MiB read buffer.
+    """
+    with open(path, "rb", buffering=1 << 20) as f:
+        yield from f
+
+class _ReportLines:
+    """
+    Re-iterable view of a report file; every iteration streams it again via iter_lines.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter_lines(self.path)
+
+def parse_wns_tns_from_log(lines: Iterable[bytes]) -> Dict[str, Optional[float]]:
     """
     Looks for a line like 'WNS: -0.120  TNS: -57.000' (Tempus/PT)
     Returns dict with WNS/TNS floats if found, else None.
+    Single streaming pass that stops once both values are captured. This bounds only
+    this pass: the cache digest and parse_hold_presence still read the whole log.
     """
     wns, tns = None, None
-    # Common patterns
-    pat_combo = re.compile(r"WNS:\s*([+-]?\d+(?:\.\d+)?)\s+TNS:\s*([+-]?\d+(?:\.\d+)?)", re.I)
-    m = pat_combo.search(text)
-    if m:
-        try:
-            wns = float(m.group(1))
-            tns = float(m.group(2))
-        except Exception:
-            pass
-    else:
+    for line in lines:
+        # Prefilter: "ns:" is common to WNS:/TNS:; lowered because the patterns are re.I
+        if b"ns:" not in line.lower():
+            continue
+        i = line.find(b"WNS:")
+        if i >= 0:
+            fast = split_wns_tns(line[i:], _NUM)
+            if fast:
+                return {"WNS": fast[0], "TNS": fast[1]}
+        # Common patterns
+        m = _PAT_WNS_TNS.search(line)
+        if m:
+            try:
+                return {"WNS": float(m.group(1)), "TNS": float(m.group(2))}
+            except Exception:
+                pass
         # Try individual patterns if the combined one isn't present
-        m1 = re.search(r"WNS:\s*([+-]?\d+(?:\.\d+)?)", text, re.I)
-        m2 = re.search(r"TNS:\s*([+-]?\d+(?:\.\d+)?)", text, re.I)
-        if m1:
-            try: wns = float(m1.group(1))
-            except Exception: pass
-        if m2:
-            try: tns = float(m2.group(1))
-            except Exception: pass
+        if wns is None:
+            m1 = _PAT_WNS.search(line)
+            if m1:
+                try: wns = float(m1.group(1))
+                except Exception: pass
+        if tns is None:
+            m2 = _PAT_TNS.search(line)
+            if m2:
+                try: tns = float(m2.group(1))
+                except Exception: pass
+        if wns is not None and tns is not None:
+            return {"WNS": wns, "TNS": tns}
     return {"WNS": wns, "TNS": tns}
 
-def parse_hold_presence(text: str) -> bool:
+def parse_hold_presence(lines: Iterable[bytes]) -> bool:
     """
     Very rough detection of hold issues in the log.
+    Stops at the first hold violation line; a clean log is read to EOF.
     """
-    needles = [
-        "hold violation",
-        "negative hold slack",
-        "slack (hold)",
-        "Hold Slack (VIOLATED)"
-    ]
-    t = text.lower()
-    return any(n in t for n in needles)
+    for line in lines:
+        ll = line.lower()
+        if b"hold" in ll and any(n in ll for n in _HOLD_NEEDLES):
+            return True
+    return False
 
-def parse_ccopt_skew_report(skew_text: str) -> Dict[str, Dict[str, float]]:
+def parse_ccopt_skew_report(skew_lines: Iterable[bytes]) -> Dict[str, Dict[str, float]]:
     """
     Tries to extract per-domain insertion delay and global skew from a ccopt.skew.rpt-like file.
     Expected lines (examples vary by version/env):
@@ -71,21 +147,26 @@ def parse_ccopt_skew_report(skew_text: str) -> Dict[str, Dict[str, float]]:
     domains: Dict[str, Dict[str, float]] = {}
     current: Optional[str] = None
 
-    for line in skew_text.splitlines():
+    for line in skew_lines:
         line = line.strip()
-        mdom = re.match(r"(Clock\s*Domain|Domain)\s*:\s*([^\s]+)", line, re.I)
-        if mdom:
-            current = mdom.group(2)
-            domains.setdefault(current, {})
-            continue
+        low = line.lower()
+        # Cheap substring checks before touching the regex engine
+        if b"domain" in low:
+            mdom = _PAT_DOMAIN.match(line)
+            if mdom:
+                current = mdom.group(1).decode(errors="ignore")
+                domains.setdefault(current, {})
+                continue
 
         if current:
-            mins = re.search(r"(Average\s+insertion\s+delay|Insertion\s+Delay)\s*:\s*([0-9.]+)\s*ns", line, re.I)
-            if mins:
-                domains[current]["avg_insertion_ns"] = float(mins.group(2))
-            mskew = re.search(r"(Global\s+skew|Skew)\s*:\s*([0-9.]+)\s*ps", line, re.I)
-            if mskew:
-                domains[current]["global_skew_ps"] = float(mskew.group(2))
+            if b"insertion" in low or b"delay" in low:
+                mins = _PAT_INS.search(line)
+                if mins:
+                    domains[current]["avg_insertion_ns"] = float(mins.group(1))
+            if b"skew" in low:
+                mskew = _PAT_SKEW.search(line)
+                if mskew:
+                    domains[current]["global_skew_ps"] = float(mskew.group(1))
 
     return domains
 
@@ -93,18 +174,24 @@ def parse_ccopt_skew_report(skew_text: str) -> Dict[str, Dict[str, float]]:
 # Heuristic policy
 # ---------------------------
 
-def recommend_for_domain(
-    domain: str,
+# Implementation hints (identical for every domain)
+_IMPL_HINTS = (
+    "Reduce max_transition on long spines; upsize root buffers if latency balloons.",
+    "Constrain ccopt with tighter -target_skew where failing, and adjust -max_insertion_delay accordingly.",
+    "Rebalance CTS levels on critical domains; avoid over-buffering near sinks.",
+    "Re-run STA (setup/hold) across worst/best PVT corners after CTS tweak."
+)
+
+@lru_cache(maxsize=1024)
+def _recommend_core(
     wns: Optional[float],
     has_hold: bool,
     avg_insertion_ns: Optional[float],
     global_skew_ps: Optional[float],
-) -> Dict[str, Any]:
+) -> Tuple[float, float, Tuple[str, ...]]:
     """
-    Simple, actionable heuristics you can tune:
-      - If WNS is negative (setup failing), bias toward *lower* insertion delay (reduce 10–20%) and tighten skew target.
-      - If hold issues exist, slightly *increase* insertion delay (5–10%) to add margin (and/or loosen skew a touch).
-      - If global skew is high (>120 ps), tighten skew target.
+    Pure heuristic core of recommend_for_domain, memoized on its inputs.
+    Returns (target_insertion, target_skew, notes) with notes not yet prefixed by domain.
     """
     # Baseline targets if we have no data
     target_insertion = avg_insertion_ns if avg_insertion_ns is not None else 1.50
@@ -118,7 +205,7 @@ def recommend_for_domain(
         target_insertion = max(0.7, round(target_insertion * factor, 3))
         target_skew = min(70.0, target_skew)  # tighten a bit
         notes.append(
-            f"{domain}: Setup failing (WNS={wns:.3f}). Reduce insertion delay ~10–15% and tighten skew target."
+            f"Setup failing (WNS={wns:.3f}). Reduce insertion delay ~10–15% and tighten skew target."
         )
 
     if has_hold:
@@ -126,25 +213,36 @@ def recommend_for_domain(
         target_insertion = round(target_insertion * 1.08, 3)
         target_skew = max(90.0, target_skew)  # allow a bit more skew if needed
         notes.append(
-            f"{domain}: Hold issues detected. Increase insertion delay ~5–10% and review min-delay fixes."
+            "Hold issues detected. Increase insertion delay ~5–10% and review min-delay fixes."
         )
 
     if global_skew_ps is not None and global_skew_ps > 120.0:
         # Too much global skew, try to tighten
         target_skew = min(target_skew, 70.0)
-        notes.append(f"{domain}: High global skew ({global_skew_ps:.0f} ps). Target ≤70–80 ps.")
+        notes.append(f"High global skew ({global_skew_ps:.0f} ps). Target ≤70–80 ps.")
 
     # Guardrails
     target_insertion = float(min(max(target_insertion, 0.6), 2.2))  # 0.6–2.2 ns practical band
     target_skew = float(min(max(target_skew, 60.0), 120.0))        # 60–120 ps band
 
-    # Implementation hints
-    impl_hints = [
-        "Reduce max_transition on long spines; upsize root buffers if latency balloons.",
-        "Constrain ccopt with tighter -target_skew where failing, and adjust -max_insertion_delay accordingly.",
-        "Rebalance CTS levels on critical domains; avoid over-buffering near sinks.",
-        "Re-run STA (setup/hold) across worst/best PVT corners after CTS tweak."
-    ]
+    return target_insertion, target_skew, tuple(notes)
+
+def recommend_for_domain(
+    domain: str,
+    wns: Optional[float],
+    has_hold: bool,
+    avg_insertion_ns: Optional[float],
+    global_skew_ps: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Simple, actionable heuristics you can tune:
+      - If WNS is negative (setup failing), bias toward *lower* insertion delay (reduce 10–20%) and tighten skew target.
+      - If hold issues exist, slightly *increase* insertion delay (5–10%) to add margin (and/or loosen skew a touch).
+      - If global skew is high (>120 ps), tighten skew target.
+    """
+    target_insertion, target_skew, notes = _recommend_core(
+        wns, has_hold, avg_insertion_ns, global_skew_ps
+    )
 
     return {
         "domain": domain,
@@ -156,34 +254,279 @@ def recommend_for_domain(
             "wns": wns,
             "hold_issues": has_hold,
         },
-        "notes": notes,
-        "implementation_hints": impl_hints,
+        "notes": [f"{domain}: {n}" for n in notes],
+        "implementation_hints": list(_IMPL_HINTS),
     }
 
+def _domain_reco(
+    domain: str,
+    wns: Optional[float],
+    has_hold: bool,
+    avg_insertion_ns: Optional[float],
+    global_skew_ps: Optional[float],
+) -> Union["DomainReco", Dict[str, Any]]:
+    """
+    recommend_for_domain as an output record: a DomainReco Struct when msgspec is in use,
+    else recommend_for_domain's dict.
+    """
+    if msgspec is None:
+        return recommend_for_domain(domain, wns, has_hold, avg_insertion_ns, global_skew_ps)
+
+    target_insertion, target_skew, notes = _recommend_core(
+        wns, has_hold, avg_insertion_ns, global_skew_ps
+    )
+
+    return DomainReco(
+        domain=domain,
+        recommended_insertion_delay_ns=target_insertion,
+        recommended_skew_target_ps=target_skew,
+        observed=Observed(
+            avg_insertion_ns=avg_insertion_ns,
+            global_skew_ps=global_skew_ps,
+            wns=wns,
+            hold_issues=has_hold,
+        ),
+        notes=[f"{domain}: {n}" for n in notes],
+        implementation_hints=list(_IMPL_HINTS),
+    )
+
+def recommend_batch(
+    wns_arr: Iterable[Optional[float]],
+    has_hold_arr: Iterable[bool],
+    ins_arr: Iterable[Optional[float]],
+    skew_arr: Iterable[Optional[float]],
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Batched recommended (insertion_ns, skew_ps) targets for many domains/corners at once.
+    Runs as native code when numba is installed; None/NaN inputs mean "not observed".
+    Use recommend_for_domain for the notes of the domains that need them.
+    """
+    # numpy/numba are imported on first use so plain CLI runs don't pay for them
+    from _cts_kernels import targets_batch
+
+    return targets_batch(wns_arr, has_hold_arr, ins_arr, skew_arr)
+
+# ---------------------------
+# Output records (msgspec)
+# ---------------------------
+
+# With msgspec, _propose_tuning_uncached builds these Structs and _encode writes them in C
+# with no intermediate dicts; otherwise it builds plain dicts for dumps_json. Field order is
+# the JSON key order of the dicts, so both write identical bytes.
+if msgspec is not None:
+    class Observed(msgspec.Struct):
+        avg_insertion_ns: Optional[float]
+        global_skew_ps: Optional[float]
+        wns: Optional[float]
+        hold_issues: bool
+
+    class DomainReco(msgspec.Struct):
+        domain: str
+        recommended_insertion_delay_ns: float
+        recommended_skew_target_ps: float
+        observed: Observed
+        notes: List[str]
+        implementation_hints: List[str]
+
+    class Summary(msgspec.Struct):
+        wns: Optional[float]
+        tns: Optional[float]
+        hold_issues: bool
+        notes: List[str]
+
+    class TuningResult(msgspec.Struct):
+        summary: Summary
+        recommendations: List[DomainReco]
+
+    def _to_builtins(records: Any) -> Any:
+        return msgspec.to_builtins(records)
+
+    def _encode(records: Any) -> bytes:
+        """
+        Indented JSON bytes of output records; the same bytes dumps_json gives for the dicts.
+        """
+        return msgspec.json.format(msgspec.json.encode(records), indent=2)
+else:
+    def _to_builtins(records: Any) -> Any:
+        return records
+
+    _encode = dumps_json
+
 # ---------------------------
 # Main orchestration
 # ---------------------------
 
+def _file_digest(path: str) -> bytes:
+    """
+    BLAKE2b of a file's contents, read in 1 MiB chunks; equal to _text_digest of the same bytes.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+def _text_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=20).digest()
+
+# Part of every cache key: any edit to the parsing/heuristic code (this file or the shared
+# WNS/TNS fast path in _common.py) invalidates cached results without a manual version bump
+_CODE_DIGEST = _text_digest(b"".join(
+    pathlib.Path(__file__).with_name(name).read_bytes() for name in ("cts_tuner.py", "_common.py")
+))
+
+def _cache_path(
+    log_digest: bytes,
+    skew_digest: Optional[bytes],
+    wns_override: Optional[float],
+    has_hold_override: Optional[bool],
+) -> Optional[pathlib.Path]:
+    """
+    Cache file for this (log, skew, overrides) combination, or None if caching is disabled.
+    Keyed on contents (and _CODE_DIGEST), so text and file callers with the same reports
+    share entries.
+    """
+    cache_dir = os.environ.get("CTS_CACHE", ".cts_cache")
+    if not cache_dir:
+        return None
+    h = hashlib.blake2b(digest_size=20)
+    h.update(_CODE_DIGEST)
+    h.update(log_digest)
+    h.update(b"|" + (skew_digest or b""))
+    h.update(repr((wns_override, has_hold_override)).encode())
+    return pathlib.Path(cache_dir) / f"{h.hexdigest()}.json"
+
+def _cache_write(cache: pathlib.Path, data: bytes) -> None:
+    """
+    Best effort: an unwritable cache directory only costs the recompute next time.
+    """
+    # Write-then-rename so parallel --inputs workers never see a partial file
+    tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, cache)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not write cache %s (%s); continuing without it", cache, e)
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+def _cache_lookup(
+    log_digest: bytes,
+    skew_digest: Optional[bytes],
+    wns_override: Optional[float],
+    has_hold_override: Optional[bool],
+) -> Tuple[Optional[pathlib.Path], Optional[Tuple[bytes, Dict[str, Any]]]]:
+    """
+    Returns (cache file or None if disabled, (raw JSON, decoded result) or None on a miss).
+    Unreadable or corrupt entries (e.g. truncated by a full disk) count as a miss.
+    """
+    cache = _cache_path(log_digest, skew_digest, wns_override, has_hold_override)
+    if cache is None or not cache.exists():
+        return cache, None
+    try:
+        data = cache.read_bytes()
+        result = json.loads(data)
+        if not isinstance(result, dict) or "recommendations" not in result:
+            raise ValueError("not a propose_tuning result")
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unusable cache %s (%s); recomputing", cache, e)
+        return cache, None
+    logger.info("Using cached result %s", cache)
+    return cache, (data, result)
+
 def propose_tuning(
-    log_text: str,
-    skew_text: Optional[str],
+    log_text: Union[str, bytes],
+    skew_text: Optional[Union[str, bytes]],
     wns_override: Optional[float],
     has_hold_override: Optional[bool],
 ) -> Dict[str, Any]:
-    # Parse timing health
-    timing = parse_wns_tns_from_log(log_text)
+    """
+    Recommendations from the log (and optional skew report) text; see propose_tuning_json
+    for the file-streaming form. Memoized on disk per unique (log contents, skew contents,
+    overrides); see _cache_path.
+    """
+    log_data = log_text.encode() if isinstance(log_text, str) else log_text
+    skew_data = skew_text.encode() if isinstance(skew_text, str) else skew_text or None
+    cache, hit = _cache_lookup(
+        _text_digest(log_data),
+        _text_digest(skew_data) if skew_data else None,
+        wns_override,
+        has_hold_override,
+    )
+    if hit is not None:
+        return hit[1]
+
+    records = _propose_tuning_uncached(
+        log_data.splitlines(keepends=True),
+        skew_data.splitlines(keepends=True) if skew_data else None,
+        wns_override,
+        has_hold_override,
+    )
+
+    if cache is not None:
+        _cache_write(cache, _encode(records))
+    return _to_builtins(records)
+
+def propose_tuning_json(
+    log_path: str,
+    skew_path: Optional[str],
+    wns_override: Optional[float],
+    has_hold_override: Optional[bool],
+) -> bytes:
+    """
+    Same result as propose_tuning, read from the report files and returned as indented JSON
+    bytes. Files are streamed, never held in memory whole; cache hits are returned as-is
+    without a decode/encode round trip.
+    """
+    cache, hit = _cache_lookup(
+        _file_digest(log_path),
+        _file_digest(skew_path) if skew_path else None,
+        wns_override,
+        has_hold_override,
+    )
+    if hit is not None:
+        return hit[0]
+
+    data = _encode(_propose_tuning_uncached(
+        _ReportLines(log_path),
+        _ReportLines(skew_path) if skew_path else None,
+        wns_override,
+        has_hold_override,
+    ))
+
+    if cache is not None:
+        _cache_write(cache, data)
+    return data
+
+def _propose_tuning_uncached(
+    log_lines: Iterable[bytes],
+    skew_lines: Optional[Iterable[bytes]],
+    wns_override: Optional[float],
+    has_hold_override: Optional[bool],
+) -> Union["TuningResult", Dict[str, Any]]:
+    """
+    A TuningResult Struct when msgspec is in use, else propose_tuning's dict.
+    log_lines is iterated up to twice, so pass a list or _ReportLines rather than a generator.
+    """
+    # Parse timing health. The WNS/TNS pass stops at the summary line, but the hold pass reads
+    # a clean log to EOF, so with the cache digest a miss reads a log file fully twice.
+    timing = parse_wns_tns_from_log(log_lines)
     wns_auto = timing.get("WNS")
-    has_hold_auto = parse_hold_presence(log_text)
 
     wns = wns_override if wns_override is not None else wns_auto
-    has_hold = has_hold_override if has_hold_override is not None else has_hold_auto
+    if has_hold_override is not None:
+        has_hold = has_hold_override  # skip the hold pass entirely
+    else:
+        has_hold = parse_hold_presence(log_lines)
 
     # Parse skew report per domain
     domains_data: Dict[str, Dict[str, float]] = {}
-    if skew_text:
-        domains_data = parse_ccopt_skew_report(skew_text)
+    if skew_lines is not None:
+        domains_data = parse_ccopt_skew_report(skew_lines)
 
     # If no domains detected, assume single implicit domain called "default"
+    skew_unparsed = skew_lines is not None and not domains_data
     if not domains_data:
         domains_data = {"default": {"avg_insertion_ns": None, "global_skew_ps": None}}
 
@@ -191,7 +534,7 @@ def propose_tuning(
     per_domain = []
     for d, vals in domains_data.items():
         per_domain.append(
-            recommend_for_domain(
+            _domain_reco(
                 domain=d,
                 wns=wns,
                 has_hold=has_hold,
@@ -206,26 +549,48 @@ def propose_tuning(
         summary_notes.append("WNS not found; consider providing --wns override.")
     if has_hold:
         summary_notes.append("Hold issues detected; verify min-delay fixes after CTS retune.")
-    if skew_text and not per_domain:
+    if skew_unparsed:  # per_domain always holds at least "default", so test the parse result
         summary_notes.append("No domains parsed from skew report; check report format.")
 
-    return {
-        "summary": {
-            "wns": wns,
-            "tns": timing.get("TNS"),
-            "hold_issues": has_hold,
-            "notes": summary_notes,
-        },
-        "recommendations": per_domain,
+    summary = {
+        "wns": wns,
+        "tns": timing.get("TNS"),
+        "hold_issues": has_hold,
+        "notes": summary_notes,
     }
+    if msgspec is not None:
+        return TuningResult(summary=Summary(**summary), recommendations=per_domain)
+    return {"summary": summary, "recommendations": per_domain}
+
+def _parse_one(
+    log_path: str,
+    out_path: str,
+    skew_path: Optional[str],
+    wns_override: Optional[float],
+    has_hold_override: Optional[bool],
+) -> str:
+    data = propose_tuning_json(log_path, skew_path, wns_override, has_hold_override)
+    return write_bytes(out_path, data)
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--log", required=True, help="CTS/STA log (Tempus/PT)")
-    ap.add_argument("--out", required=True, help="JSON output path")
-    ap.add_argument("--skew-rpt", help="Optional ccopt.skew.rpt for per-domain insertion/skew parsing")
+    add_batch_args(ap, "--log", "CTS/STA log (Tempus/PT)")
+    ap.add_argument("--out", required=True, help="JSON output path (directory with --inputs)")
+    ap.add_argument(
+        "--skew-rpt", help="Optional ccopt.skew.rpt for per-domain insertion/skew (--log only)"
+    )
     ap.add_argument("--wns", type=float, help="Override WNS (e.g., --wns -0.120)")
     ap.add_argument("--has-hold", action="store_true", help="Force flag if hold issues exist")
-    args = ap.parse_args()
+    args = parse_batch_args(ap)
+    has_hold = True if args.has_hold else None
+
+    if args.log:
+        _parse_one(args.log, args.out, args.skew_rpt, args.wns, has_hold)
+    elif args.skew_rpt:
+        # A skew report belongs to one run; reusing it would give every corner its domain data
+        ap.error("--skew-rpt cannot be combined with --inputs")
+    else:
+        run_batch(ap, args, _parse_one, ".json", None, args.wns, has_hold)
 
-    log_t_
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,36 @@
 Usage:
   python tools/lib_check.py --lib <corner.lib> --cells NAND2_X2 BUF_X4
 """
-import argparse, sys, logging, csv, json, pathlib
+import argparse, sys, logging, csv, json, pathlib, re
 from typing import List, Dict, Any
 import pandas as pd
 
+from _common import dumps_json
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# Liberty cell declarations: cell (NAME) or cell ("NAME"), but not groups like test_cell (X)
+_CELL_RE = re.compile(rb'\bcell\s*\(\s*"?([A-Za-z_]\w*)"?\s*\)')
+
+def missing_cells(data: bytes, cells: List[str]) -> List[str]:
+    # Exact names: BUF is missing even if BUF_X4 is declared
+    names = {m.group(1).decode() for m in _CELL_RE.finditer(data)}
+    return [c for c in cells if c not in names]
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--lib", required=True)
     ap.add_argument("--cells", nargs="*", default=[])
     args = ap.parse_args()
 
-    text = pathlib.Path(args.lib).read_text(errors="ignore")
+    data = pathlib.Path(args.lib).read_bytes()
     findings = {"missing_cells": [], "max_transition_ns": None, "max_capacitance_pf": None}
     # Placeholder scanning
     if args.cells:
-        findings["missing_cells"] = [c for c in args.cells if c not in text]
+        findings["missing_cells"] = missing_cells(data, args.cells)
     pathlib.Path("outputs").mkdir(parents=True, exist_ok=True)
-    pathlib.Path("outputs/lib_check.json").write_text(json.dumps(findings, indent=2))
+    pathlib.Path("outputs/lib_check.json").write_bytes(dumps_json(findings))
     logger.info("Wrote outputs/lib_check.json")
 
 if __name__ == "__main__":
@@ -4,21 +4,22 @@
 Usage:
   python tools/netlist_diff.py --a a.v --b b.v --out outputs/netdiff.json
 """
-import argparse, sys, logging, csv, json, pathlib
+import argparse, sys, logging, csv, json, pathlib, re
+from collections import Counter
 from typing import List, Dict, Any
 import pandas as pd
 
+from _common import dumps_json
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-def summarize_modules(text: str) -> Dict[str, int]:
-    counts = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if line.startswith("module "):
-            name = line.split()[1].split("(")[0]
-            counts[name] = counts.get(name, 0) + 1
-    return counts
+# Module declarations, one pass over the whole netlist; names may contain $, and
+# escaped identifiers (\foo.bar) run up to the next whitespace
+_MOD_RE = re.compile(rb"^[ \t]*module[ \t]+([A-Za-z_][\w$]*|\\\S+)", re.M)
+
+def summarize_modules(data: bytes) -> Dict[str, int]:
+    return Counter(m.group(1).decode(errors="ignore") for m in _MOD_RE.finditer(data))
 
 def main():
     ap = argparse.ArgumentParser()
@@ -27,16 +28,16 @@ def main():
     ap.add_argument("--out", required=True)
     args = ap.parse_args()
 
-    a = summarize_modules(pathlib.Path(args.a).read_text(errors="ignore"))
-    b = summarize_modules(pathlib.Path(args.b).read_text(errors="ignore"))
+    a = summarize_modules(pathlib.Path(args.a).read_bytes())
+    b = summarize_modules(pathlib.Path(args.b).read_bytes())
     delta = {
-        "only_in_a": sorted(set(a) - set(b)),
-        "only_in_b": sorted(set(b) - set(a)),
+        "only_in_a": sorted(a.keys() - b.keys()),
+        "only_in_b": sorted(b.keys() - a.keys()),
         "counts_a": a,
         "counts_b": b,
     }
     pathlib.Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    pathlib.Path(args.out).write_text(json.dumps(delta, indent=2))
+    pathlib.Path(args.out).write_bytes(dumps_json(delta))
     logger.info("Wrote %s", args.out)
 
 if __name__ == "__main__":
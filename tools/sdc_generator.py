@@ -5,7 +5,7 @@ Usage:
   python tools/sdc_generator.py --spec samples/constraints_spec.yaml --out outputs/top.sdc
 """
 import argparse, sys, logging, csv, json, pathlib
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import pandas as pd
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
@@ -13,22 +13,30 @@ logger = logging.getLogger(__name__)
 
 import yaml
 
-def emit_sdc(spec: Dict[str, Any]) -> str:
-    lines = []
+# Shared tail for every IO delay line
+_CLK_SUFFIX = " -clock [get_clocks *]\n"
+
+def iter_sdc(spec: Dict[str, Any]) -> Iterator[str]:
+    """Yield newline-terminated SDC lines so large specs can be written without buffering."""
     for clk in spec.get("clocks", []):
-        lines.append(f"create_clock -name {clk['name']} -period {clk['period']} -waveform {{{clk['waveform'][0]} {clk['waveform'][1]}}} [get_ports {clk['port']}]")
+        yield f"create_clock -name {clk['name']} -period {clk['period']} -waveform {{{clk['waveform'][0]} {clk['waveform'][1]}}} [get_ports {clk['port']}]\n"
     io = spec.get("io_delays", {})
     for ip in io.get("inputs", []):
-        lines.append(f"set_input_delay -max {ip['max']} [get_ports {ip['port']}] -clock [get_clocks *]")
-        lines.append(f"set_input_delay -min {ip['min']} [get_ports {ip['port']}] -clock [get_clocks *]")
+        ports = f" [get_ports {ip['port']}]" + _CLK_SUFFIX
+        yield f"set_input_delay -max {ip['max']}" + ports
+        yield f"set_input_delay -min {ip['min']}" + ports
     for op in io.get("outputs", []):
-        lines.append(f"set_output_delay -max {op['max']} [get_ports {op['port']}] -clock [get_clocks *]")
-    for fp in spec.get("exceptions", {}).get("false_paths", []):
-        lines.append(f"set_false_path -from {fp['from'][0]} -to {fp['to'][0]}")
-    for mc in spec.get("exceptions", {}).get("multicycle", []):
-        lines.append(f"set_multicycle_path {mc['setup']} -setup -from {mc['from'][0]} -to {mc['to'][0]}")
-        lines.append(f"set_multicycle_path {mc['hold']} -hold  -from {mc['from'][0]} -to {mc['to'][0]}")
-    return "\n".join(lines) + "\n"
+        yield f"set_output_delay -max {op['max']} [get_ports {op['port']}]" + _CLK_SUFFIX
+    exceptions = spec.get("exceptions", {})
+    for fp in exceptions.get("false_paths", []):
+        yield f"set_false_path -from {fp['from'][0]} -to {fp['to'][0]}\n"
+    for mc in exceptions.get("multicycle", []):
+        from_to = f" -from {mc['from'][0]} -to {mc['to'][0]}\n"
+        yield f"set_multicycle_path {mc['setup']} -setup" + from_to
+        yield f"set_multicycle_path {mc['hold']} -hold " + from_to
+
+def emit_sdc(spec: Dict[str, Any]) -> str:
+    return "".join(iter_sdc(spec))
 
 def main():
     ap = argparse.ArgumentParser()
@@ -37,9 +45,9 @@ def main():
     args = ap.parse_args()
 
     spec = yaml.safe_load(pathlib.Path(args.spec).read_text())
-    sdc = emit_sdc(spec)
     pathlib.Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    pathlib.Path(args.out).write_text(sdc)
+    with pathlib.Path(args.out).open("w") as f:
+        f.writelines(iter_sdc(spec))
     logger.info("Wrote %s", args.out)
 
 if __name__ == "__main__":
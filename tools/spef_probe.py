@@ -3,32 +3,41 @@
 
 Usage:
   python tools/spef_probe.py --spef <path.spef> --nets net1 net2 --out outputs/spef_summary.csv
+  python tools/spef_probe.py --inputs 'corners/*.spef' --nets net1 net2 --out outputs/spef --jobs 8
 """
 import argparse, sys, logging, csv, json, pathlib
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 
+from _batch import add_batch_args, parse_batch_args, run_batch, write_csv
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-def parse_spef(text: str, nets: List[str]) -> pd.DataFrame:
+def parse_spef(data: bytes, nets: List[str]) -> pd.DataFrame:
     # Placeholder: search for nets and fake-cap summary
-    rows = []
-    for n in nets:
-        rows.append({"Net": n, "TotalCap(pF)": 0.0, "RC_Est(ns)": 0.0})
-    return pd.DataFrame(rows)
+    # Built column-wise (no row dicts); float32 is ample precision for pF/ns summaries
+    return pd.DataFrame({
+        "Net": list(nets),
+        "TotalCap(pF)": np.zeros(len(nets), dtype=np.float32),
+        "RC_Est(ns)": np.zeros(len(nets), dtype=np.float32),
+    })
+
+def _parse_one(spef: str, out: str, nets: List[str]) -> str:
+    return write_csv(out, parse_spef(pathlib.Path(spef).read_bytes(), nets))
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--spef", required=True)
+    add_batch_args(ap, "--spef", "SPEF file")
     ap.add_argument("--nets", nargs="+", required=True)
-    ap.add_argument("--out", required=True)
-    args = ap.parse_args()
+    ap.add_argument("--out", required=True, help="CSV output path (output directory with --inputs)")
+    args = parse_batch_args(ap)
 
-    df = parse_spef(pathlib.Path(args.spef).read_text(errors="ignore"), args.nets)
-    pathlib.Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(args.out, index=False)
-    logger.info("Wrote %s", args.out)
+    if args.spef:
+        _parse_one(args.spef, args.out, args.nets)
+    else:
+        run_batch(ap, args, _parse_one, ".csv", args.nets)
 
 if __name__ == "__main__":
     main()
@@ -3,45 +3,67 @@
 
 Usage:
   python tools/sta_report_parser.py --report <report.rpt> --out outputs/sta_summary.csv
+  python tools/sta_report_parser.py --inputs 'corners/*.rpt' --out outputs/sta --jobs 8
 """
-import argparse, sys, logging, csv, json, pathlib
+import argparse, sys, logging, csv, json, pathlib, re
 from typing import List, Dict, Any
 import pandas as pd
 
+from _batch import add_batch_args, parse_batch_args, run_batch, write_csv
+from _common import split_wns_tns
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-def parse_report_text(text: str) -> Dict[str, Any]:
+# Single-pass patterns over the raw report bytes (no decode of the whole file)
+_SUMMARY_RE = re.compile(rb"WNS:[ \t]*([+-]?[\d.]+).*?TNS:[ \t]*([+-]?[\d.]+)")
+# Number grammar of _SUMMARY_RE, for the split_wns_tns fast path
+_NUM_RE = re.compile(rb"[+-]?[\d.]+")
+_EP_RE = re.compile(rb"^[ \t]*(Startpoint|Endpoint):[ \t]*(.*)$", re.M)
+
+def parse_report_text(data: bytes) -> Dict[str, Any]:
     # Naive parsing; adjust for your report formatting
     summary = {"WNS": None, "TNS": None, "paths": []}
-    for line in text.splitlines():
-        if "WNS:" in line and "TNS:" in line:
+    # Last summary line wins; try bytes.rfind on it before scanning with the regex
+    i = data.rfind(b"WNS:")
+    fast = split_wns_tns(data[i:i + 200].split(b"\n", 1)[0], _NUM_RE) if i >= 0 else None
+    if fast:
+        summary["WNS"], summary["TNS"] = fast
+    else:
+        for m in _SUMMARY_RE.finditer(data):
             try:
-                parts = line.replace("WNS:", "WNS ").replace("TNS:", "TNS ").split()
-                summary["WNS"] = float(parts[1])
-                summary["TNS"] = float(parts[3])
-            except Exception:
+                summary["WNS"] = float(m.group(1))
+                summary["TNS"] = float(m.group(2))
+            except ValueError:
                 pass
-        if line.strip().startswith("Startpoint:"):
-            path = {"start": line.split("Startpoint:")[1].strip()}
-            summary["paths"].append(path)
-        if line.strip().startswith("Endpoint:") and summary["paths"]:
-            summary["paths"][-1]["end"] = line.split("Endpoint:")[1].strip()
+    for m in _EP_RE.finditer(data):
+        # Only the small captured names are decoded
+        value = m.group(2).strip().decode(errors="ignore")
+        if m.group(1) == b"Startpoint":
+            summary["paths"].append({"start": value})
+        elif summary["paths"]:
+            summary["paths"][-1]["end"] = value
     return summary
 
+def _parse_one(report: str, out: str) -> str:
+    data = parse_report_text(pathlib.Path(report).read_bytes())
+    rows = [
+        {"WNS": data["WNS"], "TNS": data["TNS"], "Start": p.get("start",""), "End": p.get("end","")}
+        for p in data["paths"]
+    ]
+    df = pd.DataFrame(rows or [{"WNS": data["WNS"], "TNS": data["TNS"], "Start": "", "End": ""}])
+    return write_csv(out, df)
+
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--report", required=True, help="STA report file (Tempus/PT)")
-    ap.add_argument("--out", required=True, help="CSV output path")
-    args = ap.parse_args()
+    add_batch_args(ap, "--report", "STA report file (Tempus/PT)")
+    ap.add_argument("--out", required=True, help="CSV output path (output directory with --inputs)")
+    args = parse_batch_args(ap)
 
-    text = pathlib.Path(args.report).read_text(errors="ignore")
-    data = parse_report_text(text)
-    rows = [{"WNS": data["WNS"], "TNS": data["TNS"], "Start": p.get("start",""), "End": p.get("end","")} for p in data["paths"]]
-    df = pd.DataFrame(rows or [{"WNS": data["WNS"], "TNS": data["TNS"], "Start": "", "End": ""}])
-    pathlib.Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(args.out, index=False)
-    logger.info("Wrote %s", args.out)
+    if args.report:
+        _parse_one(args.report, args.out)
+    else:
+        run_batch(ap, args, _parse_one, ".csv")
 
 if __name__ == "__main__":
     main()
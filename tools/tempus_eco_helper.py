@@ -6,27 +6,43 @@ Usage:
 """
 import argparse, sys, logging, csv, json, pathlib
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 
+from _common import positive_int
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
 def analyze_paths(df: pd.DataFrame) -> pd.DataFrame:
     # Very simple heuristic placeholder
     df = df.copy()
-    df["Recommendation"] = df.apply(lambda r: "Consider buffer/gate resize on critical arc" if (pd.notna(r.get("WNS")) and r.get("WNS", 0) < 0) else "No action"), axis=1)
+    wns = df.get("WNS", pd.Series(index=df.index, dtype=float))
+    mask = wns.lt(0).fillna(False)
+    df["Recommendation"] = np.where(
+        mask, "Consider buffer/gate resize on critical arc", "No action"
+    )
     return df
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--paths_csv", required=True, help="CSV from sta_report_parser")
     ap.add_argument("--out", required=True, help="CSV with ECO suggestions")
+    ap.add_argument(
+        "--chunksize", type=positive_int, default=200_000, help="Rows per read/write chunk"
+    )
     args = ap.parse_args()
 
-    df = pd.read_csv(args.paths_csv)
-    out = analyze_paths(df)
     pathlib.Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    out.to_csv(args.out, index=False)
+    # Stream in bounded chunks; analyze_paths is row-independent. Pin the slack
+    # columns to float so every chunk is written the same way.
+    first = True
+    reader = pd.read_csv(
+        args.paths_csv, chunksize=args.chunksize, dtype={"WNS": float, "TNS": float}
+    )
+    for chunk in reader:
+        analyze_paths(chunk).to_csv(args.out, mode="w" if first else "a", header=first, index=False)
+        first = False
     logger.info("Wrote %s", args.out)
 
 if __name__ == "__main__":